@@ -30,28 +30,24 @@ import pyglet
 CLOCK = ClockExt()
 pyglet.clock.set_default(CLOCK)  # set alt. clock with pause functionality
 
-import random, time, importlib, sys
+import random
 import itertools as it
-from typing import Optional, List, Union, Tuple, Type
+from typing import (Optional, List, Set, FrozenSet, Dict, Union, Tuple, 
+                    Callable)
 from collections import OrderedDict as OrdDict
-from copy import copy
-from threading import Thread
 
 from pyglet.sprite import Sprite
-from pyglet.image import TextureRegion
-from pyglet.text import Label
 
 import pyroids
 from .lib.pyglet_lib.sprite_ext import (PhysicalSprite, SpriteAdv, 
                                         AvoidRect, InRect, load_image)
-from .lib.pyglet_lib.drawing import AngledGrid, Rectangle, DrawingBase
+from .lib.pyglet_lib.drawing import AngledGrid, Rectangle
 from .game_objects import (Ship, ShipRed, ControlSystem, Asteroid, 
                            AmmoClasses, Bullet, Mine, Starburst, 
                            PickUp, PickUpRed)
 from .labels import (StartLabels, NextLevelLabel, LevelLabel, EndLabels,
-                     InstructionLabels, StockLabel, InfoRow)
-from .lib.iter_util import (increment_last, factor_last, 
-                            repeat_sequence, repeat_last)
+                     InstructionLabels, InfoRow)
+from .lib.iter_util import factor_last, repeat_last
 
 LEVEL_AUGMENTATION = 1.05
 
@@ -86,6 +82,22 @@ RED_CONTROLS = {'THRUST_KEY': [pyglet.window.key.W],
                                       pyglet.window.key.C: 6})
                 }
 
+# Keys that start a game, mapped to the number of players.
+_NUM_PLAYERS_KEYS = {pyglet.window.key._1: 1,
+                     pyglet.window.key.NUM_1: 1,
+                     pyglet.window.key.F1: 1,
+                     pyglet.window.key._2: 2,
+                     pyglet.window.key.NUM_2: 2,
+                     pyglet.window.key.F2: 2}
+
+# Class methods that stop / resume sound of all instances of classes that 
+# play sound, executed by Game.--_stop_all_sound-- and 
+# Game.--_resume_all_sound--.
+_STOP_SOUND_FUNCS = (SpriteAdv.stop_all_sound, Starburst.stop_all_sound,
+                     *(AmmoCls.stop_cls_sound for AmmoCls in AmmoClasses))
+_RESUME_SOUND_FUNCS = (SpriteAdv.resume_all_sound, Starburst.resume_all_sound,
+                       *(AmmoCls.resume_cls_sound for AmmoCls in AmmoClasses))
+
 #GLOBAL CONSTANTS
 WIN_X = 1200
 WIN_Y = 800
@@ -141,6 +153,10 @@ settings = ['BLUE_CONTROLS', 'RED_CONTROLS',
 pyroids._config_import(vars(), settings)
 assert PICKUP_INTERVAL_MAX >= PICKUP_INTERVAL_MIN
 
+# Evaluated from settings once any configuration file settings imported.
+_MIN_WIN = min(WIN_X, WIN_Y)  # Shorter of window's sides
+_HALF_MIN_WIN = _MIN_WIN/2  # Maximum radiation field width
+
 Ship.set_controls(controls=BLUE_CONTROLS)
 ShipRed.set_controls(controls=RED_CONTROLS)
 
@@ -157,6 +173,11 @@ inst_batch = pyglet.graphics.Batch()  # instructions page
 
 #GROUPS
 class RadGroup(pyglet.graphics.OrderedGroup):
+    # Line width set on every draw as GL line width is global state that
+    # is set to 3, and not reset, by labels' CrossOutGroup which is drawn
+    # (as part of ---info_batch---) after the radiation field. Caching the
+    # last width set would require every group that sets the line width
+    # to maintain the cache, to save a single GL call per frame.
     def set_state(self):
         pyglet.gl.glLineWidth(1)
 
@@ -182,12 +203,14 @@ class Player(object):
             Maintain lives and score
             Schedule supply drops with each drop made between 
                 ----PICKUP_INTERVAL---- and ----PICKUP_INTERVAL*2----
-                seconds after the prior drop (or start of game) and only 
-                in event total drops during game will not exceed 
-                --max_pickups--
+                seconds after the prior drop (or after --max_pickups--
+                is increased beyond drops made) and only in event total 
+                drops during game will not exceed --max_pickups--
             
     Class ATTRIBUTES
     ---PickUpCls--- dictionary defining PickUp class for each player color
+    ---resurrect_margin--- margin around each live sprite to be avoided 
+        when positioning a resurrected ship.
 
     Instance ATTRIBUTES
     --game-- Game instance in which player participating.
@@ -211,7 +234,13 @@ class Player(object):
     PickUpCls = {'blue': PickUp,
                  'red': PickUpRed}
 
-    def __init__(self, game: pyglet.window.Window, 
+    resurrect_margin = 3 * Ship.img.width
+
+    __slots__ = ('game', '_color', 'control_sys', 'ship', '_score', 'lives',
+                 '_info_row', '_pickups_cumulative', '_max_pickups',
+                 '__weakref__')
+
+    def __init__(self, game: pyglet.window.Window,
                  color: Union['blue', 'red'], 
                  avoid: Optional[List[AvoidRect]] = None):
         """Initialises a player.
@@ -222,7 +251,7 @@ class Player(object):
         
         Creates a ControlSystem. Requests a ship positioned to avoid any 
         rectangles defined in +avoid+. Creates an InfoRow to display 
-        player related information. Starts supply drop schedule.
+        player related information.
         """
         self.game = game
         self._color = color
@@ -237,9 +266,9 @@ class Player(object):
                                  num_lives=LIVES, 
                                  level_label=self.game.level_label.label)
 
+        # Supply drop scheduled once --max_pickups-- increased.
         self._pickups_cumulative = 0
         self._max_pickups = 0
-        self._schedule_drop()
 
     @property
     def color(self):
@@ -257,9 +286,14 @@ class Player(object):
                                               batch=game_batch, 
                                               group=game_group,
                                               on_kill=self._lose_life, 
+                                              on_die=self._ship_deceased,
                                               **kwargs)
-        self.ship.position_randomly(avoid=avoid)
-        self.ship.rotate_randomly()
+        self.ship.place_randomly(avoid=avoid)
+        self.game._register_ship(self.ship)
+
+    def _ship_deceased(self):
+        # Called whenever --ship-- deceases, whether or not killed.
+        self.game._unregister_ship(self.ship)
         
     @property
     def score(self):
@@ -269,6 +303,7 @@ class Player(object):
     def score(self, value):
         self._score = value
         self._info_row.update_score_label(value)
+        self.game._scores_changed()
         
     def add_to_score(self, increment: int):
         """Increases player score by +increment+"""
@@ -280,7 +315,12 @@ class Player(object):
 
     @max_pickups.setter
     def max_pickups(self, value: int):
+        # A drop is only scheduled whilst pickups remain to be dropped 
+        # (see --_drop_pickup--). Re-arms schedule if it was idle.
+        idle = self._pickups_cumulative >= self._max_pickups
         self._max_pickups = value
+        if idle and self._pickups_cumulative < value:
+            self._schedule_drop()
 
     def increase_max_pickups(self, num: int):
         """Increases maximum number of pickups by +num+"""
@@ -290,11 +330,13 @@ class Player(object):
         if self._pickups_cumulative < self.max_pickups:
             self.PickUpCls[self.color](batch=game_batch, group=game_group)
             self._pickups_cumulative += 1
-        self._schedule_drop()
+        # Not rescheduled once limit reached, rather rescheduled by 
+        # --max_pickups-- setter when limit next increased.
+        if self._pickups_cumulative < self.max_pickups:
+            self._schedule_drop()
     
     def _schedule_drop(self):
-        ext = random.randint(0, PICKUP_INTERVAL_MAX - PICKUP_INTERVAL_MIN)
-        drop_time = PICKUP_INTERVAL_MIN + ext
+        drop_time = random.randint(PICKUP_INTERVAL_MIN, PICKUP_INTERVAL_MAX)
         pyglet.clock.schedule_once(self._drop_pickup, drop_time)
 
     def _unschedule_calls(self):
@@ -308,9 +350,9 @@ class Player(object):
         
         +dt+ captures 'elapsed time' if called via scheduled event.
         """
-        avoid = []
-        for sprite in PhysicalSprite.live_physical_sprites:
-            avoid.append(AvoidRect(sprite, margin = 3 * Ship.img.width))
+        margin = self.resurrect_margin
+        avoid = [AvoidRect(sprite, margin=margin) 
+                 for sprite in PhysicalSprite.live_physical_sprites]
         self.request_ship(avoid=avoid, cruise_speed=self.game.ship_speed,
                           rotation_cruise_speed=self.game.ship_rotation_speed)
                                
@@ -364,6 +406,9 @@ class RadiationField(object):
         
     nuclear_img = load_image('radiation.png', anchor='center')
 
+    __slots__ = ('batch', 'group', '_grid', '_field_width', '_rect',
+                 '_nuclear_sprites', '__weakref__')
+
     def __init__(self):
         self.batch = game_batch
         self.group = rad_group
@@ -371,22 +416,40 @@ class RadiationField(object):
         self._grid: AngledGrid  # Set by --_add_grid--
         self._add_grid()
 
-        self._field_width: int
+        self._field_width: int = 0  # Set by --set_field--
         self._rect = None
         self._nuclear_sprites = []
+
+        # No field until set, hence grid not drawn (see --_set_grid--).
+        self._grid.remove_from_batch()
                 
     def _add_grid(self):
-        # Add grid lines to ---game_batch--- as a VectorList
+        # Add grid lines to ---game_batch--- as a single VertexList. All 
+        # lines are drawn in GL_LINES mode from one vertex list with 
+        # 'static' usage. The grid is never rebuilt although the vertex 
+        # list is migrated to and from the shelf batch, copying its data, 
+        # whenever the field is removed or restored (see --_set_grid--).
         self._grid = AngledGrid(x_min=0, x_max=WIN_X, y_min=0, y_max=WIN_Y,
                                 vertical_spacing=50, angle=45, 
                                 color=(80, 80, 80),
                                 batch=self.batch, group=self.group)
     
+    def _set_grid(self, prev_width: int):
+        # Without a field the grid would be wholly covered by the blackout 
+        # rect. Rather than draw it to no effect, grid is removed from 
+        # ---game_batch--- whilst there is no field.
+        if self._field_width and not prev_width:
+            self._grid.return_to_batch()
+        elif prev_width and not self._field_width:
+            self._grid.remove_from_batch()
+
     def _set_blackout_rect(self):
         if self._rect is not None:
             self._rect.remove_from_batch()
-        # Do not draw blackout rect if radiation field fills window
-        if min(WIN_X, WIN_Y)/2 - self._field_width < 1:
+            self._rect = None
+        # Do not draw blackout rect if there is no field (window is cleared 
+        # to black) or if radiation field fills window
+        if not self._field_width or _HALF_MIN_WIN - self._field_width < 1:
             return
         self._rect = Rectangle(self._field_width, WIN_X - self._field_width,
                                self._field_width, WIN_Y - self._field_width,
@@ -394,71 +457,84 @@ class RadiationField(object):
                                fill_color=(0, 0, 0)
                                )
         
-    def _add_nuclear_sprite(self, x, y):
-        # Add radiation symbols to ---game_batch--- as sprites
-        sprite = Sprite(self.nuclear_img, x, y, 
+    def _nuclear_sprite(self, x, y) -> Sprite:
+        # Return new radiation symbol, added to ---game_batch---, at (x, y).
+        # All symbols MUST share the same parent group (--group--) and the
+        # same texture (---nuclear_img---). pyglet evaluates the equality of
+        # each sprite's internal SpriteGroup from its parent group, texture
+        # and blend mode, such that sharing these ensures all symbols resolve
+        # to a single group of the batch and are drawn together.
+        sprite = Sprite(self.nuclear_img, x, y,
                       batch=self.batch, group=self.group)
-        if sprite.width > self._field_width:
-            sprite.scale = round(self._field_width/sprite.width, 1)
-        self._nuclear_sprites.append(sprite)
+        sprite.scale = self._nuclear_scale()
         return sprite
+
+    def _nuclear_scale(self) -> float:
+        """Return scale for radiation symbols to fit current field width."""
+        width = self.nuclear_img.width
+        if width > self._field_width:
+            return round(self._field_width/width, 1)
+        return 1
         
     def _delete_nuclear_sprites(self):
         for sprite in self._nuclear_sprites:
             sprite.delete()
-        self._nuclear_sprites = []
+        self._nuclear_sprites.clear()
 
-    def _set_nuclear_sprites(self):
-        if self._nuclear_sprites:
-            self._delete_nuclear_sprites()
-        if self._field_width is 0:
-            return
+    def _nuclear_positions(self) -> List[Tuple[int, int]]:
+        """Return positions of all radiation symbols for current field width.
+
+        Symbols placed at regular intervals down each side of the field 
+        and, between the side symbols, along the bottom and top of the field.
+        """
         half_width = self._field_width//2
-        min_separation = self.nuclear_img.height*4
+        x_left, x_right = half_width, WIN_X - half_width
+        y_top, y_bot = WIN_Y - half_width - 8, half_width
+        nuke_height = self.nuclear_img.height
 
-        # Create nuclear sprites on LHS
-        top_sprite = self._add_nuclear_sprite(half_width, WIN_Y-half_width-8)
-        lhs_sprites = [top_sprite]
-        bot_sprite = self._add_nuclear_sprite(half_width, half_width)
-        
-        vert_num = WIN_Y//min_separation
+        # y coordinates of side symbols, from top to bottom
+        ys = [y_top]
+        vert_num = WIN_Y//(nuke_height*4)
         if vert_num > 2:
-            diff = top_sprite.y - bot_sprite.y
-            vert_separation = diff//(vert_num -2 +1)
-            y = top_sprite.y - vert_separation
-            for i in range(0, vert_num-2):
-                sprite = self._add_nuclear_sprite(half_width, y)
-                lhs_sprites.append(sprite)
-                y -= vert_separation
-        lhs_sprites.append(bot_sprite)
-
-        # 'Mirror' LHS to RHS
-        rhs_sprites = []
-        for lhs_sprite in lhs_sprites[:]:
-            sprite = self._add_nuclear_sprite(WIN_X-half_width, lhs_sprite.y)
-            rhs_sprites.append(sprite)
-
-        # Create bottom sprites, between existing bot sprites on lhs and rhs
-        min_separation = round(self.nuclear_img.height*4.5)
-        bottom_sprites = []
-        horz_num = WIN_X//min_separation
-        if horz_num >2:
-            diff = rhs_sprites[-1].x - lhs_sprites[-1].x
-            horz_separation = diff//(horz_num -2 +1)
-            x = lhs_sprites[-1].x + horz_separation 
-            for i in range(0, horz_num-2):
-                sprite = self._add_nuclear_sprite(x, half_width)
-                bottom_sprites.append(sprite)
-                x += horz_separation
-
-        # 'Mirror' bot to top
-        for bottom_sprite in bottom_sprites[:]:
-            self._add_nuclear_sprite(bottom_sprite.x, top_sprite.y)
+            vert_separation = (y_top - y_bot)//(vert_num - 1)
+            ys += [y_top - vert_separation * i for i in range(1, vert_num - 1)]
+        ys.append(y_bot)
+
+        # x coordinates of bottom and top symbols, between the side symbols
+        xs = []
+        horz_num = WIN_X//round(nuke_height*4.5)
+        if horz_num > 2:
+            horz_separation = (x_right - x_left)//(horz_num - 1)
+            xs = [x_left + horz_separation * i for i in range(1, horz_num - 1)]
+
+        positions = [(x_left, y) for y in ys] + [(x_right, y) for y in ys]
+        positions += [(x, y_bot) for x in xs] + [(x, y_top) for x in xs]
+        return positions
+
+    def _set_nuclear_sprites(self):
+        if self._field_width == 0:
+            if self._nuclear_sprites:
+                self._delete_nuclear_sprites()
+            return
+        positions = self._nuclear_positions()
+        # Number of symbols independent of field width, hence existing 
+        # symbols are repositioned rather than recreated.
+        if len(positions) == len(self._nuclear_sprites):
+            scale = self._nuclear_scale()
+            for sprite, (x, y) in zip(self._nuclear_sprites, positions):
+                sprite.update(x=x, y=y, scale=scale)
+            return
+        if self._nuclear_sprites:
+            self._delete_nuclear_sprites()
+        self._nuclear_sprites.extend(self._nuclear_sprite(x, y) 
+                                     for x, y in positions)
 
     def set_field(self, width: float):
         """Set/reset radiation field to border of width ++width++."""
-        assert width <= min(WIN_Y, WIN_X)/2
+        assert width <= _HALF_MIN_WIN
+        prev_width = self._field_width
         self._field_width = width
+        self._set_grid(prev_width)
         self._set_blackout_rect()
         self._set_nuclear_sprites()
 
@@ -517,7 +593,7 @@ class Game(pyglet.window.Window):
     --all_players--  List of Players
     --player_winning--  Player that is currently winning
     --num_players--  Number of Players
-    --players_ships--  List of player's current Ships
+    --players_ships--  Set of player's current Ships
     --ship_speed--  Ship speed setting for current level
     --ship_rotation_speed--  Ship rotation speed setting for current level
     """
@@ -531,10 +607,35 @@ class Game(pyglet.window.Window):
         super().__init__(*args, width=WIN_X, height=WIN_Y, **kwargs)
         PhysicalSprite.setup(window=self, at_boundary='bounce')
         
-        self.players_alive = []  # Appended to by --_add_player--
-        self.players_dead = []  # Appended to by --_move_player_to_dead--
+        # Players held as OrderedDict keys (values None) to provide for 
+        # ordered iteration together with constant time removal.
+        # Added to by --_add_player--
+        self.players_alive: Dict[Player, None] = OrdDict()
+        # Added to by --_move_player_to_dead--
+        self.players_dead: Dict[Player, None] = OrdDict()
         self._num_players: int  # Set by --_start_game--
 
+        # Seconds remaining until game ends after all players have died.
+        # Set by --_count_down_to_end_game--, reset by --_end_game--.
+        self._end_game_countdown: Optional[float] = None
+
+        # Maintained on changes to player membership and ship lives, such 
+        # that --all_players-- and --players_ships-- are not re-evaluated 
+        # each time accessed.
+        self._all_players: List[Player] = []  # Set by --_set_all_players--
+        self._live_ships: Set[Ship] = set()  # Maintained by Player via
+                                             # --_register_ship-- and
+                                             # --_unregister_ship--
+
+        # Maps each player's control system to the player. Employed to 
+        # identify player responsible for a bullet.
+        self._player_by_control_sys: Dict[ControlSystem, Player] = {}
+
+        # --player_winning-- only re-evaluated if scores or players have 
+        # changed since last evaluated.
+        self._player_winning: Optional[Player] = None
+        self._player_winning_stale = True  # Set by --_scores_changed--
+
         # Initialise LEVEL SETTINGS.
         # Value of each level setting reassigned for each new level.
         # Each value set by a dedicated method (keys of --_settings_map--)
@@ -547,7 +648,10 @@ class Game(pyglet.window.Window):
         self._spawn_limit: int = 0
         self._num_per_spawn: int = 0
         
-        self._settings_map: dict  # Set / reset by --_set_settings_map()--
+        # Level setting values are re-evaluated for each game as the 
+        # iterators defining them may return different values each game.
+        self._settings_map: dict  # Set by --_start_game()--
+        self._next_level_index = 0  # Reset by --_start_game()--
         
         self._rad_field = RadiationField()
         
@@ -563,6 +667,9 @@ class Game(pyglet.window.Window):
                                }
         
         self._app_state: str
+        # Bound draw methods of batches to be drawn for current state, 
+        # set by --app_state-- setter.
+        self._current_draws: Tuple[Callable, ...]
         self.app_state = 'start'
         self._pre_instructions_app_state: Optional[str] = None
 
@@ -588,6 +695,8 @@ class Game(pyglet.window.Window):
     def app_state(self, state):
         assert state in self._state_batches
         self._app_state = state
+        self._current_draws = tuple(batch.draw for batch 
+                                    in self._state_batches[state])
 
     def _set_settings_map(self):
         # Each item represents a level setting
@@ -597,11 +706,11 @@ class Game(pyglet.window.Window):
         #   responsible for implementing all conseqeunces of change in 
         #   level setting value. NB All setter functions are class methods.
         #
-        # Value an iterator that returns the level setting values, with 
-        #   first interation returning value for level 1 and each subsequent
-        #   call returning value for each successive level. NB iterator 
-        #   defined as the return of a function assigned to a corresponding 
-        #   global constant.
+        # Value a tuple of the level setting values, with first item as 
+        #   value for level 1 and each subsequent item as value for each 
+        #   successive level through to ----LAST_LEVEL----. NB values 
+        #   evaluated from the iterator returned by the function assigned 
+        #   to a corresponding global constant.
         map = OrdDict({self._set_level: it.count(1, 1),
                        self._set_ship_speed: SHIP_SPEED(),
                        self._set_ship_rotation_speed: SHIP_ROTATION_SPEED(),
@@ -616,6 +725,8 @@ class Game(pyglet.window.Window):
                        self._set_high_exposure_limit: HIGH_EXPOSURE_LIMIT(),
                        self._set_pickups: NUM_PICKUPS()
                        })
+        for setter_method, iterator in map.items():
+            map[setter_method] = tuple(it.islice(iterator, LAST_LEVEL))
         self._settings_map = map
 
     # Window keypress handler.
@@ -638,7 +749,7 @@ class Game(pyglet.window.Window):
         number pad) or F1 or F2 will start game for 1 or 2 players whilst 
         key press of escape will exit the application.
         """
-        if self.app_state in ['game', 'next_level']:
+        if self.app_state in ('game', 'next_level'):
             if symbol == pyglet.window.key.F12:
                 self._user_pause()
             else:
@@ -646,28 +757,30 @@ class Game(pyglet.window.Window):
         elif self.app_state == 'instructions':
             self._return_from_instructions_screen()
         else:
-            assert self.app_state in ['start', 'end']
+            assert self.app_state in ('start', 'end')
             if symbol == pyglet.window.key.ENTER:
                 return self._show_instructions_screen(paused=False)
-            elif symbol in [pyglet.window.key._1,
-                            pyglet.window.key.NUM_1,
-                            pyglet.window.key.F1]:
-                players=1
-            elif symbol in [pyglet.window.key._2, 
-                            pyglet.window.key.NUM_2,
-                            pyglet.window.key.F2]:
-                players=2
             elif symbol == pyglet.window.key.ESCAPE:
                 self._end_app()
                 return
-            else:
-                return
-            self._start_game(players)
+            players = _NUM_PLAYERS_KEYS.get(symbol)
+            if players is not None:
+                self._start_game(players)
             
     # PLAYERS
+    def _set_all_players(self):
+        # Executed on every change to --players_alive-- or --players_dead--
+        self._all_players = list(it.chain(self.players_alive,
+                                          self.players_dead))
+        self._scores_changed()
+
+    def _scores_changed(self):
+        """Advise game that a player's score has changed"""
+        self._player_winning_stale = True
+
     @property
     def all_players(self) -> List[Player]:
-        return self.players_alive + self.players_dead
+        return self._all_players
 
     @property
     def num_players(self) -> int:
@@ -677,17 +790,23 @@ class Game(pyglet.window.Window):
     def player_winning(self) -> Optional[Player]:
         """Returns Player with the highest current score, or None 
         if more than one player has the highest current score"""
-        scores = [player.score for player in self.all_players]
-        max_score = max(scores)
-        tie = True if scores.count(max_score) > 1 else False
-        if tie:
-            return None
-        else:
-            return max(self.all_players, key= lambda player: player.score)
+        if not self._player_winning_stale:
+            return self._player_winning
+        winning, max_score, tie = None, None, False
+        for player in self.all_players:
+            score = player.score
+            if max_score is None or score > max_score:
+                winning, max_score, tie = player, score, False
+            elif score == max_score:
+                tie = True
+        self._player_winning = None if tie else winning
+        self._player_winning_stale = False
+        return self._player_winning
         
     def _move_player_to_dead(self, player: Player):
-        self.players_alive.remove(player)
-        self.players_dead.append(player)
+        del self.players_alive[player]
+        self.players_dead[player] = None
+        self._set_all_players()
 
     def player_dead(self, player: Player):
         """Advise game that +player+ has died"""
@@ -696,19 +815,27 @@ class Game(pyglet.window.Window):
     def _delete_all_players(self):
         for player in self.all_players:
             player.delete()
-        self.players_alive = []
-        self.players_dead = []
+        self.players_alive.clear()
+        self.players_dead.clear()
+        self._player_by_control_sys.clear()
+        self._set_all_players()
+
+    def _register_ship(self, ship: Ship):
+        """Advise game that +ship+ is a live player's ship"""
+        self._live_ships.add(ship)
+
+    def _unregister_ship(self, ship: Ship):
+        """Advise game that +ship+ has deceased"""
+        self._live_ships.discard(ship)
 
     @property
-    def players_ships(self) -> List[Ship]:
-        """Returns list of live Ship objects.
+    def players_ships(self) -> FrozenSet[Ship]:
+        """Returns set of live Ship objects.
         NB dead or currently resurrecting Players will not be represented.
         """
-        ships = []
-        for player in self.all_players:
-            if player.ship.live:
-                ships.append(player.ship)
-        return ships
+        # Returns snapshot such that callers can neither modify the 
+        # maintained set nor have it change size whilst iterating it.
+        return frozenset(self._live_ships)
 
     def _withdraw_players(self):
         for player in self.all_players:
@@ -718,7 +845,9 @@ class Game(pyglet.window.Window):
     def _add_player(self, color: Union['blue', 'red'],
                    avoid: Optional[List[AvoidRect]] = None) -> Player:
         player = Player(game=self, color=color, avoid=avoid)
-        self.players_alive.append(player)
+        self.players_alive[player] = None
+        self._player_by_control_sys[player.control_sys] = player
+        self._set_all_players()
         return player
         
     def _set_players(self) -> Player:
@@ -737,43 +866,61 @@ class Game(pyglet.window.Window):
                             spawn_limit=self._spawn_limit, 
                             num_per_spawn=self._num_per_spawn,
                             at_boundary=AT_BOUNDARY)
-        asteroid.position_randomly(avoid=avoid)
-        asteroid.rotate_randomly()
+        asteroid.place_randomly(avoid=avoid)
 
     def _add_asteroids(self, num_asteroids: int):
-        avoid = []
-        for ship in self.players_ships:
-            avoid.append(AvoidRect(ship, margin = 6 * ship.width))
+        avoid = [AvoidRect(ship, margin = 6 * ship.width) 
+                 for ship in self.players_ships]
         for i in range(num_asteroids):
             self._add_asteroid(avoid=avoid)
 
     # REFRESH METHOD related methods
+
+    # Maps 2-tuples of types of colliding objects to the index of the 
+    # Bullet, or None if collision not between an Asteroid and a Bullet. 
+    # Populated by --_asteroid_and_bullet-- as each pair of types is 
+    # first encountered.
+    #
+    # PhysicalSprite.---collision_layer--- is only used to skip evaluating 
+    # collisions between sprites of the same layer.
+    _bullet_index: Dict[Tuple[type, type], Optional[int]] = {}
+
+    @staticmethod
+    def _eval_bullet_index(types: Tuple[type, type]) -> Optional[int]:
+        """Return index of Bullet type in +types+ if +types+ comprises 
+        an Asteroid type and a Bullet type, otherwise None.
+        """
+        if issubclass(types[0], Asteroid) and issubclass(types[1], Bullet):
+            return 1
+        elif issubclass(types[0], Bullet) and issubclass(types[1], Asteroid):
+            return 0
+        else:
+            return None
+
     def _asteroid_and_bullet(self, 
                              collision: Tuple[PhysicalSprite, PhysicalSprite],
                              ) -> Union[Bullet, bool]:
         """If +collision+ between Asteroid and Bullet then return Bullet, 
         otherwise return False.
         """
-        c = collision
-        if isinstance(c[0], Asteroid) and isinstance(c[1], Bullet):
-            return c[1]
-        elif isinstance(c[0], Bullet) and isinstance(c[1], Asteroid):
-            return c[0]
-        else:
-            return False
+        types = (type(collision[0]), type(collision[1]))
+        try:
+            i = self._bullet_index[types]
+        except KeyError:
+            i = self._bullet_index[types] = self._eval_bullet_index(types)
+        return False if i is None else collision[i]
         
     def _identify_firer(self, bullet: Bullet) -> Optional[Player]:
         """Return Player responsible for +bullet+"""
-        for player in self.all_players:
-            if player.control_sys is bullet.control_sys:
-                return player
+        return self._player_by_control_sys.get(bullet.control_sys)
 
     def _no_asteroids(self) -> bool:
-        """Advise if there are any asteroids left"""
-        for sprite in PhysicalSprite.live_physical_sprites:
-            if isinstance(sprite, Asteroid):
-                return False
-        return True
+        """Advise if all asteroids have deceased.
+
+        Evaluated from Asteroid.---live_count--- rather than by inspecting 
+        the live sprites.
+        """
+        return Asteroid.live_count == 0
 
     def _check_for_points(self,
                           collision: Tuple[PhysicalSprite, PhysicalSprite]):
@@ -785,10 +932,8 @@ class Game(pyglet.window.Window):
         bullet = self._asteroid_and_bullet(collision)
         if bullet:
             firer = self._identify_firer(bullet)
-            try:
+            if firer is not None:
                 firer.add_to_score(1)
-            except AttributeError:
-                pass
 
     # REFRESH. Game UPDATE
     # All non-stationary game sprites have PhysicalSprite as a base. The
@@ -802,10 +947,10 @@ class Game(pyglet.window.Window):
     # --_refresh()-- is scheduled, via --_start_refresh--, to be called 
     # 100 times a second.
     #
-    # --_refresh()-- is unsheduled by --_stop_refresh()--. 
-    #
-    # --_refresh()-- is scheduled at the start of each level and unscheduled 
-    # at the end of each level and the end of a game.
+    # --_refresh()-- is scheduled at the start of a game and unscheduled 
+    # at the end of a game. Between levels --_refresh()-- continues to be 
+    # called although returns without effect whilst the app state is other 
+    # than 'game'.
     #
     # --_refresh()-- is also effectively disabled and enabled by 
     # --_user_pause()-- and --_user_resume()-- which pause and resume the 
@@ -822,21 +967,30 @@ class Game(pyglet.window.Window):
         If all players dead then moves to end game.
         If no asteroids left then moves to next level
         Otherwise updates position of all PhysicalSprite objects
+
+        Returns without effect if app state is other than 'game'.
         """
+        if self.app_state != 'game':
+            return
         collisions = PhysicalSprite.eval_collisions()
-        live_physical_sprites = PhysicalSprite.live_physical_sprites
+        # Liveness checked as each collision is resolved, rather than 
+        # filtering all collisions before resolving any, as resolving a 
+        # collision can decease a sprite involved in a later collision.
+        live_sprites = PhysicalSprite.live_physical_sprites_set
+        check_for_points = self._check_for_points
         for c in collisions:
-            if c[0] in live_physical_sprites and c[1] in live_physical_sprites:
-                self._check_for_points(c)
-                c[0].collided_with(c[1])
-                c[1].collided_with(c[0])
+            obj, other_obj = c
+            if obj in live_sprites and other_obj in live_sprites:
+                check_for_points(c)
+                obj.collided_with(other_obj)
+                other_obj.collided_with(obj)
 
         if not self.players_alive:
-            return pyglet.clock.schedule_once(self._end_game, 1)
+            return self._count_down_to_end_game(dt)
         elif self._no_asteroids():
             return self._next_level_page()
         else:
-            for sprite in live_physical_sprites:
+            for sprite in PhysicalSprite.live_physical_sprites:
                 sprite.refresh(dt)
 
     # PAGE AND SOUND CONTROL
@@ -854,12 +1008,24 @@ class Game(pyglet.window.Window):
             self._stop_all_sound()
         SpriteAdv.decease_selective(exceptions=exceptions)
 
+    def _count_down_to_end_game(self, dt: float):
+        """End game one second after first called.
+        
+        +dt+ Seconds elapsed since prior call.
+        """
+        # Counted down by --_refresh()-- rather than scheduling --_end_game()-- 
+        # which would otherwise be scheduled on every refresh until the 
+        # game ended.
+        if self._end_game_countdown is None:
+            self._end_game_countdown = 1
+        else:
+            self._end_game_countdown -= dt
+            if self._end_game_countdown <= 0:
+                self._end_game()
+
     def _start_refresh(self):
         pyglet.clock.schedule_interval(self._refresh, 1/100.0)
 
-    def _stop_refresh(self):
-        pyglet.clock.unschedule(self._refresh)
-
     def _freeze_ships(self):
         for ship in self.players_ships:
             ship.freeze()
@@ -874,12 +1040,13 @@ class Game(pyglet.window.Window):
         # including --_next_level()-- scheduled by --_next_level_page()--
         #
         # Sound not stopped, rather bleeds into inter-level pause.
-        self._stop_refresh()
+        #
+        # --_refresh()-- remains scheduled although has no effect whilst 
+        # app state is 'next_level'.
         self._freeze_ships()
 
     def _unpause_for_next_level(self):
         """Resume game for purpose of starting a new level"""
-        self._start_refresh()
         self._unfreeze_ships()
 
     def _show_instructions_screen(self, paused: bool = False):
@@ -912,18 +1079,14 @@ class Game(pyglet.window.Window):
             self.end_labels.set_labels(winner=False, completed=completed)
 
     def _stop_all_sound(self):
-        SpriteAdv.stop_all_sound()
-        Starburst.stop_all_sound()
-        for AmmoCls in AmmoClasses:
-            AmmoCls.stop_cls_sound()
+        for func in _STOP_SOUND_FUNCS:
+            func()
         for ship in self.players_ships:
             ship.control_sys.radiation_monitor.stop_sound()
 
     def _resume_all_sound(self):
-        SpriteAdv.resume_all_sound()
-        Starburst.resume_all_sound()
-        for AmmoCls in AmmoClasses:
-            AmmoCls.resume_cls_sound()
+        for func in _RESUME_SOUND_FUNCS:
+            func()
         for ship in self.players_ships:
             ship.control_sys.radiation_monitor.resume_sound()
 
@@ -988,6 +1151,11 @@ class Game(pyglet.window.Window):
     # the value to an instance attribute but rather rather send it 
     # directly to wherever it's required to implement the consequences 
     # of the change.
+    #
+    # Setters that act on each ship or player iterate --players_ships-- 
+    # or --players_alive-- directly. Both are maintained on changes to 
+    # ships and players rather than evaluated from the players when 
+    # accessed.
     
     def _set_level(self, value):
         self._level = value
@@ -1051,7 +1219,7 @@ class Game(pyglet.window.Window):
             border = 0
         elif border > 1:
             border = 1
-        field_width = int((min(WIN_X, WIN_Y)*border)//2)
+        field_width = int((_MIN_WIN*border)//2)
         return field_width
 
     def _get_cleaner_space_field(self, field_width) -> InRect:
@@ -1078,8 +1246,10 @@ class Game(pyglet.window.Window):
 
     def _setup_next_level(self):
         """Assign level settings for next level and reload cannon."""
-        for setter_method, iterator in self._settings_map.items():
-            setter_method(next(iterator))
+        i = self._next_level_index
+        for setter_method, values in self._settings_map.items():
+            setter_method(values[i])
+        self._next_level_index += 1
         for player in self.players_alive:
             player.control_sys.cannon_full_reload()
 
@@ -1101,7 +1271,8 @@ class Game(pyglet.window.Window):
         """set/reset game and proceeds to play first level"""
         self._num_players = num_players
         self._setup_mine_cls()
-        self._set_settings_map()  # Creates new iterators for level settings
+        self._set_settings_map()
+        self._next_level_index = 0  # Level settings from level 1
         self._set_players()
         self.set_mouse_visible(False)
         self._play_level(first_level=True)
@@ -1110,8 +1281,8 @@ class Game(pyglet.window.Window):
         """Play next level after clearing screen of all sprites that should 
         not bleed over.
         """
-        self._decease_game_sprites(exceptions=self.players_ships + 
-                                   [PickUp, PickUpRed])
+        self._decease_game_sprites(exceptions=[*self.players_ships,
+                                               PickUp, PickUpRed])
         self._play_level()
 
     def _next_level_page(self):
@@ -1127,7 +1298,6 @@ class Game(pyglet.window.Window):
     def _unschedule_calls(self):
         pyglet.clock.unschedule(self._refresh)
         pyglet.clock.unschedule(self._next_level)
-        pyglet.clock.unschedule(self._end_game)
 
     def _end_game(self, dt=None, escaped=False, completed=False):
         """Set end game state and stop player interaction with game.
@@ -1136,6 +1306,7 @@ class Game(pyglet.window.Window):
         +completed+ True if game ended by way of player(s) completing 
             last level (as opposed to losing all lives).
         """
+        self._end_game_countdown = None
         self._set_end_state(escaped, completed)
         self._withdraw_players()
         self._decease_game_sprites(kill_sound=True)
@@ -1150,5 +1321,5 @@ class Game(pyglet.window.Window):
         Overrides inhertied event handler.
         """
         self.clear()
-        for batch in self._state_batches[self.app_state]:
-            batch.draw()
\ No newline at end of file
+        for draw in self._current_draws:
+            draw()
\ No newline at end of file
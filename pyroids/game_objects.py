@@ -151,6 +151,7 @@ class Bullet(Ammunition, PhysicalSprite):
     """
     img = load_image('bullet.png', anchor='center')
     snd = load_static_sound('nn_bullet.wav')
+    collision_layer = 'bullet'  # bullets do not collide with each other
 
     img_pickup = img
     img_stock = img
@@ -390,6 +391,7 @@ class Mine(Ammunition, PhysicalSprite):
     """
     
     img = anim('mine.png', 1, 9, frame_duration=1)
+    collision_layer = 'mine'  # mines do not collide with each other
     img_pickup = img.frames[-1].image
     img_stock = img_pickup
     snd = load_static_sound('nn_minelaid.wav')
@@ -1483,9 +1485,15 @@ class Asteroid(PhysicalSprite):
     End-of-Life
     .kill() if killed in-game
     .die() if deceasing object out-of-game
+
+    Class ATTRIBUTES
+    ---live_count---  Number of instantiated instances that have not 
+        subsequently deceased.
     """
     
     img = load_image('pyroid.png', anchor='center')
+    collision_layer = 'asteroid'  # asteroids do not collide with each other
+    live_count = 0
 
     def __init__(self, spawn_level=0, spawn_limit=5, num_per_spawn=3, 
                  at_boundary='bounce', **kwargs):
@@ -1501,6 +1509,7 @@ class Asteroid(PhysicalSprite):
         self._spawn_level=spawn_level
         self._spawn_limit=spawn_limit
         self._num_per_spawn=num_per_spawn
+        Asteroid.live_count += 1
         
     def _spawn(self):
         """Spawn new asteroids if spawn level below spawn limit."""
@@ -1526,6 +1535,10 @@ class Asteroid(PhysicalSprite):
         self._spawn()
         self._explode()
         super().kill()
+
+    def die(self, *args, **kwargs):
+        Asteroid.live_count -= 1
+        super().die(*args, **kwargs)
         
     def collided_with(self, other_obj):
         if isinstance(other_obj, (Bullet, Ship, Shield)):
@@ -1593,6 +1606,7 @@ class PickUp(PhysicalSprite):
     """
     
     img = load_image('pickup_blue.png', anchor='center')  # Background
+    collision_layer = 'pickup'  # pickups do not collide with each other
     snd = load_static_sound('supply_drop_blue.wav')
     snd_pickup = load_static_sound('nn_resupply.wav')
 
@@ -392,7 +392,7 @@ class InstructionLabels(WindowLabels):
         """
         text = ''
         for i, key in enumerate(keys):
-            sep = '' if i is 0 else ', '
+            sep = '' if i == 0 else ', '
             key_text = pyglet.window.key.symbol_string(key).strip('_')
             text = sep.join([text, key_text])
         return text
@@ -680,7 +680,7 @@ class StockLabel(pyglet.text.layout.TextLayout):
         end = len(self.document.text)
         self.document.delete_text(1, end)
         self.document.insert_text(1, self._label_text(stock))
-        if stock is 0:
+        if stock == 0:
             self._cross_out()
         elif self._crossed_out:
             self._delete_cross_out()
@@ -771,7 +771,7 @@ class InfoRow(object):
         to default behaviour otherwise. NB Default behaviour ASSUMES +obj+ 
         anchored to bottom left corner.
         """
-        if sep is not 0:
+        if sep != 0:
             self._advance_x(sep)
         obj.batch = self._batch if batch is None else batch
         obj.y = self._info_row_base if y is None else y
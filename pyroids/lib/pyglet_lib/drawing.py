@@ -48,9 +48,15 @@ class DrawingBase(object):
     --_coords()--  Should return a tuple of vertices co-ordinates. For 
         example, to describe a 100x100 rectangle:
         (100, 100, 100, 200, 200, 200, 200, 100)
+
+    Subclasses can define the class attribute ---_usage--- to change the 
+    usage hint, as taken by pyglet, of the vertex list's data. Implemented 
+    on this base class as 'static' on the basis that a drawing's data is 
+    uploaded once and not subsequently changed.
     """
 
     _shelf_batch = pyglet.graphics.Batch()
+    _usage = 'static'
 
     def __init__(self, color = (255, 255, 255, 255), 
                  batch: Optional[pyglet.graphics.Batch] = None, 
@@ -119,10 +125,10 @@ class DrawingBase(object):
     def _set_vertices_data(self):
         coords = self._coords()
         self._count = len(coords)//2
-        self._vertices_data = ('v2i', coords)
+        self._vertices_data = ('v2i/' + self._usage, coords)
         
     def _set_color_data(self):
-        self._color_data = ('c4B', self._color * self.count)
+        self._color_data = ('c4B/' + self._usage, self._color * self.count)
 
     def _set_data(self):
         self._set_vertices_data()
@@ -32,14 +32,13 @@ vector_anchor_to_rotated_point()  Evalute vector to rotated point.
 Helper CLASSES:
 InRect()  Check if a point lies in a defined rectangle
 AvoidRect(InRect)  Define an area to avoid as a rectangle around a sprite 
+SpatialHashGrid()  Hash sprites to grid cells to find neighbouring pairs.
 """
 
-import random, math, time
+import random, math
 import collections.abc
 from itertools import combinations
-from copy import copy
 from typing import Optional, Tuple, List, Union, Sequence, Callable, Dict
-from functools import wraps
 
 import pyglet
 from pyglet.image import Texture, TextureRegion, Animation
@@ -66,7 +65,14 @@ def load_image(filename: str, anchor: Union['origin', 'center'] = 'origin'
                ) -> TextureRegion:
     """Load image with +filename+ from resource.
     
-    +anchor+ Set anchor points to image 'origin' or 'center'"""
+    +anchor+ Set anchor points to image 'origin' or 'center'
+
+    Image is loaded via pyglet.resource which packs images of up to 
+    1024 pixels into texture atlases shared by all resource images. 
+    Returned TextureRegion therefore shares its texture with other images 
+    loaded from resource, such that sprites of different images can be 
+    drawn without changing the bound texture.
+    """
     assert anchor in ['origin', 'center']
     img = pyglet.resource.image(filename)
     if anchor == 'center':
@@ -240,6 +246,62 @@ class AvoidRect(InRect):
 
         super().__init__(x_from, x_to, y_from, y_to)
 
+class SpatialHashGrid(object):
+    """Uniform grid of square cells to which positions are hashed.
+
+    Intended use is to identify pairs of sprites that are close enough to 
+    each other to have possibly collided, such that only those pairs need 
+    be evaluated for a collision.
+
+    Each position is hashed to the single cell that contains it. Any two 
+    positions separated by less than the cell size will be hashed to the 
+    same or adjacent cells. Positions are referred to by their index in 
+    the sequences passed to --populate--.
+
+    METHODS
+    --populate(xs, ys, cell_size)--  Hash positions to cells of +cell_size+.
+    --neighbour_pairs()--  Return iterator of pairs of indices of positions 
+        hashed to the same or adjacent cells.
+    """
+
+    # Offsets to half of the 8 adjacent cells such that each pair of 
+    # adjacent cells is visited only once.
+    _ADJACENT = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+    def __init__(self):
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+
+    def populate(self, xs: Sequence[float], ys: Sequence[float], 
+                 cell_size: Union[int, float]):
+        """Hash positions to cells of +cell_size+, replacing any positions 
+        previously hashed.
+
+        +xs+ x coordinates of positions.
+        +ys+ y coordinates of positions, same length as +xs+.
+        """
+        cells = self._cells
+        cells.clear()
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            cell = (int(x // cell_size), int(y // cell_size))
+            try:
+                cells[cell].append(i)
+            except KeyError:
+                cells[cell] = [i]
+
+    def neighbour_pairs(self):
+        """Return iterator of 2-tuples of indices of positions hashed to 
+        the same or adjacent cells. Each pair is included once."""
+        cells = self._cells
+        for (x, y), indices in cells.items():
+            yield from combinations(indices, 2)
+            for dx, dy in self._ADJACENT:
+                others = cells.get((x + dx, y + dy))
+                if others is None:
+                    continue
+                for i in indices:
+                    for j in others:
+                        yield (i, j)
+
 class SpriteAdv(Sprite, StaticSourceMixin):
     """Extends Sprite class functionality.
 
@@ -604,6 +666,13 @@ class PhysicalSprite(SpriteAdv):
     Class ATTRIBUTES
     ---live_physical_sprites--- List of all instantiated PhysicalSprite 
         instances that have not subsequently deceased.
+    ---live_physical_sprites_set--- Set of same instances as 
+        ---live_physical_sprites---. Provides for testing membership.
+    ---collision_layer--- None or name of collision layer. Sprites of the 
+        same collision layer are not evaluated as colliding with each 
+        other. Subclass should define if its instances have no interest 
+        in colliding with each other. None (default) if instances can 
+        collide with any sprite.
 
     The following attributes are available for inspection although it is not 
     intended that the value are reassigned:
@@ -630,6 +699,8 @@ class PhysicalSprite(SpriteAdv):
     --refresh(dt)--  Move and rotate sprite given elapsed time +dt+.
     --position_randomly(+avoid+)--  Move sprite to random position within 
         available window area excluding area defined by +avoid+.
+    --place_randomly(+avoid+)--  Move sprite to random position, as 
+        --position_randomly()--, and rotate to random direction.
 
     To set the sprite speeds and rotation:
         --speed_set()--  Set current speed.
@@ -676,9 +747,26 @@ class PhysicalSprite(SpriteAdv):
     (which the client, should it wish, should advise independently of 
     the collision).
     """
+
+    # Attributes accessed whenever sprite moved held in slots. NB pyglet 
+    # Sprite does not define __slots__ and hence instances retain a 
+    # __dict__ for all other attributes.
+    __slots__ = ('_at_boundary', '_speed', '_speed_cruise', '_rotation_speed',
+                 '_rotation_speed_cruise', '_vel_x', '_vel_y')
         
     live_physical_sprites: list
+    live_physical_sprites_set: set
+    collision_layer: Optional[str] = None
     _window: pyglet.window.BaseWindow
+
+    # Collisions evaluated via ---_grid--- only when number of live sprites 
+    # at least ---_GRID_THRESHOLD---. Below the threshold checking every 
+    # pair is quicker than populating the grid.
+    _GRID_THRESHOLD = 32
+    _grid = SpatialHashGrid()
+
+    # List returned by ---eval_collisions---, reused on each call.
+    _collisions: List[Tuple[Sprite, Sprite]] = []
     X_MIN: int
     X_MAX: int
     Y_MIN: int
@@ -708,6 +796,7 @@ class PhysicalSprite(SpriteAdv):
         border argument passed.
         """
         cls.live_physical_sprites = []
+        cls.live_physical_sprites_set = set()
         cls._window = window
         cls.chk_atboundary_opt(at_boundary)
         cls.AT_BOUNDARY = at_boundary
@@ -734,12 +823,59 @@ class PhysicalSprite(SpriteAdv):
 
         NB Basis for proximity evaluation ASSUJMES sprite image anchored 
         at image's center.
+
+        If there are at least ---_GRID_THRESHOLD--- live sprites then 
+        only pairs of sprites hashed to the same or adjacent cells of 
+        a SpatialHashGrid are evaluated. Cell size is the width of the 
+        widest sprite, such that any two sprites close enough to have 
+        collided will be hashed to the same or adjacent cells. Returned 
+        collisions are the same, and in the same order, as if every pair 
+        had been evaluated.
+
+        NB The same list object is returned by every call, cleared and 
+        repopulated, such that the returned list is only valid until the 
+        next call.
         """
-        collisions = []
-        for obj, other_obj in combinations(copy(cls.live_physical_sprites), 2):
-            min_separation = (obj.width + other_obj.width)//2
-            if distance(obj, other_obj) < min_separation:
-                collisions.append((obj, other_obj))
+        # No copy taken of ---live_physical_sprites--- as sprites cannot 
+        # decease whilst collisions are evaluated.
+        sprites = cls.live_physical_sprites
+        # Read sprite positions and widths once, into sequences indexed 
+        # as --sprites--, rather than for every pair evaluated.
+        xs = [sprite.x for sprite in sprites]
+        ys = [sprite.y for sprite in sprites]
+        widths = [sprite.width for sprite in sprites]
+        layers = [sprite.collision_layer for sprite in sprites]
+
+        use_grid = len(sprites) >= cls._GRID_THRESHOLD
+        if use_grid:
+            cell_size = max(max(widths), 1)
+            cls._grid.populate(xs, ys, cell_size)
+            pairs = cls._grid.neighbour_pairs()
+        else:
+            pairs = combinations(range(len(sprites)), 2)
+
+        # Compares squared distance to squared minimum separation to 
+        # avoid evaluating a square root for every pair.
+        #
+        # Minimum separation evaluated for each pair rather than looked up 
+        # from a table keyed by class pairs. Widths are not constant for a 
+        # class (for example, spawned asteroids are scaled) and the 
+        # addition is in any event cheaper than a lookup.
+        hits = []
+        for i, j in pairs:
+            if layers[i] is not None and layers[i] == layers[j]:
+                continue
+            min_separation = (widths[i] + widths[j])//2
+            dx = xs[i] - xs[j]
+            dy = ys[i] - ys[j]
+            if dx*dx + dy*dy < min_separation*min_separation:
+                hits.append((i, j) if i < j else (j, i))
+
+        if use_grid:
+            hits.sort()  # Order as would have been evaluated by combinations
+        collisions = cls._collisions
+        collisions.clear()
+        collisions.extend((sprites[i], sprites[j]) for i, j in hits)
         return collisions
     
     def __init__(self, initial_speed=0, initial_rotation_speed=0,
@@ -759,6 +895,7 @@ class PhysicalSprite(SpriteAdv):
                                      ' before instantiating instances')
         super().__init__(**kwargs)
         self.live_physical_sprites.append(self)
+        self.live_physical_sprites_set.add(self)
         self._at_boundary = at_boundary if at_boundary is not None\
             else self.AT_BOUNDARY
         self.chk_atboundary_opt(self._at_boundary)
@@ -857,7 +994,11 @@ class PhysicalSprite(SpriteAdv):
         
         +dt+ Seconds elapsed since object last rotated.
         """
-        self.rotate(self._rotation_speed*dt)
+        # Sprites not rotating (all bullets and asteroids) skip rotation 
+        # which would otherwise recompute the sprite's vertices and 
+        # velocities on every refresh to no effect.
+        if self._rotation_speed:
+            self.rotate(self._rotation_speed*dt)
 
     # SPEED and ROTATION
     def stop(self):
@@ -961,6 +1102,16 @@ class PhysicalSprite(SpriteAdv):
         """Move sprite to random position within available window area."""
         self.update(x=self._random_x(), y=self._random_y())
 
+    def _random_xy_avoiding(self, avoid: List[AvoidRect]) -> Tuple[int, int]:
+        """Return random position within available window area albeit 
+        outside of any rectangular area defined in +avoid+.
+        """
+        # A candidate is rejected on the first rectangle it falls inside.
+        while True:
+            xy = self._random_xy()
+            if not any(avd.inside(xy) for avd in avoid):
+                return xy
+
     def position_randomly(self, avoid: Optional[List[AvoidRect]] = None):
         """Move sprite to random position within available window area.
         
@@ -969,14 +1120,24 @@ class PhysicalSprite(SpriteAdv):
         """
         if not avoid:
             return self._position_randomly()
-            
-        conflicts = [True] * len(avoid)
-        while True in conflicts:
-            xy = self._random_xy()
-            for i, avd in enumerate(avoid):
-                conflicts[i] = True if avd.inside(xy) else False
+        x, y = self._random_xy_avoiding(avoid)
+        self.update(x=x, y=y)
 
-        self.update(x=xy[0], y=xy[1])
+    def place_randomly(self, avoid: Optional[List[AvoidRect]] = None):
+        """Move sprite to random position and rotate to random direction.
+        
+        +avoid+ List of AvoidRect defining rectangular areas to exclude 
+            from available window area.
+        """
+        # Position and rotation set with a single call to --update()-- 
+        # such that sprite's vertices are recomputed once, rather than 
+        # once by each of --position_randomly()-- and --rotate_randomly()--.
+        if avoid:
+            x, y = self._random_xy_avoiding(avoid)
+        else:
+            x, y = self._random_xy()
+        self.update(x=x, y=y, rotation=random.randint(0, 360))
+        self._refresh_velocities()
 
     def _eval_new_position(self, dt: Union[float, int]) -> Tuple[int, int]:
         """Return obj's new position given elapsed time and ignoring bounds.
@@ -991,13 +1152,21 @@ class PhysicalSprite(SpriteAdv):
 
     def _move_to(self, x, y):
         """Move obj to position (+x+, +y+)."""
-        self.update(x=x, y=y)
+        # Sets position directly rather than via --update()-- which, on 
+        # every refresh, would otherwise check each of its keyword 
+        # arguments. Either recomputes the sprite's vertices once.
+        self.position = (x, y)
 
     def _move(self, dt: Union[float, int]):
         """Move object to new position given elapsed time.
         
         +dt+ Seconds elapsed since sprite last moved.
         """
+        # Stationary sprites (for example a ship not under thrust) skip 
+        # moving which would otherwise recompute the sprite's vertices for 
+        # an unchanged position.
+        if not self._speed:
+            return
         x, y = self._eval_new_position(dt)
         x_inbounds = self._x_inbounds(x)
         y_inbounds = self._y_inbounds(y)
@@ -1034,6 +1203,7 @@ class PhysicalSprite(SpriteAdv):
 
     def die(self, *args, **kwargs):
         self.live_physical_sprites.remove(self)
+        self.live_physical_sprites_set.discard(self)
         super().die(*args, **kwargs)
 
 
@@ -1089,29 +1259,31 @@ class PhysicalSpriteInteractive(PhysicalSprite):
     # the appropriate handler via --_execute_any_key_handler--.
     
 
-    _NUMPAD_KEYS = (pyglet.window.key.NUM_0,
-                   pyglet.window.key.NUM_1,
-                   pyglet.window.key.NUM_2,
-                   pyglet.window.key.NUM_3,
-                   pyglet.window.key.NUM_4,
-                   pyglet.window.key.NUM_5,
-                   pyglet.window.key.NUM_6,
-                   pyglet.window.key.NUM_7,
-                   pyglet.window.key.NUM_8,
-                   pyglet.window.key.NUM_9)
-
-    _NUMROW_KEYS = (pyglet.window.key._0,
-                   pyglet.window.key._1,
-                   pyglet.window.key._2,
-                   pyglet.window.key._3,
-                   pyglet.window.key._4,
-                   pyglet.window.key._5,
-                   pyglet.window.key._6,
-                   pyglet.window.key._7,
-                   pyglet.window.key._8,
-                   pyglet.window.key._9)
-
-    _NUM_KEYS = _NUMPAD_KEYS + _NUMROW_KEYS
+    # Number keys held as frozensets to provide for hashed membership 
+    # tests on each keyboard event.
+    _NUMPAD_KEYS = frozenset((pyglet.window.key.NUM_0,
+                              pyglet.window.key.NUM_1,
+                              pyglet.window.key.NUM_2,
+                              pyglet.window.key.NUM_3,
+                              pyglet.window.key.NUM_4,
+                              pyglet.window.key.NUM_5,
+                              pyglet.window.key.NUM_6,
+                              pyglet.window.key.NUM_7,
+                              pyglet.window.key.NUM_8,
+                              pyglet.window.key.NUM_9))
+
+    _NUMROW_KEYS = frozenset((pyglet.window.key._0,
+                              pyglet.window.key._1,
+                              pyglet.window.key._2,
+                              pyglet.window.key._3,
+                              pyglet.window.key._4,
+                              pyglet.window.key._5,
+                              pyglet.window.key._6,
+                              pyglet.window.key._7,
+                              pyglet.window.key._8,
+                              pyglet.window.key._9))
+
+    _NUM_KEYS = _NUMPAD_KEYS | _NUMROW_KEYS
 
     _pyglet_key_handler: pyglet.window.key.KeyStateHandler
     _interactive_setup = False